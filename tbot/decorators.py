@@ -57,24 +57,28 @@ def testcase(tc: F_tc) -> F_tc:
             return int(x, 16)
     """
 
+    # Resolve the name and log-event functions once at decoration time
+    # instead of on every call
+    name = tc.__name__
+    testcase_begin = log_event.testcase_begin
+    testcase_end = log_event.testcase_end
+
     @functools.wraps(tc)
     def wrapped(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
-        log_event.testcase_begin(tc.__name__)
-        start = time.monotonic()
+        testcase_begin(name)
+        start = time.perf_counter()
         try:
             result = tc(*args, **kwargs)
         except tbot.SkipException as e:
-            log_event.testcase_end(
-                tc.__name__, time.monotonic() - start, skipped=str(e)
-            )
+            testcase_end(name, time.perf_counter() - start, skipped=str(e))
             return None
         except:  # noqa: E722
-            log_event.testcase_end(tc.__name__, time.monotonic() - start, False)
+            testcase_end(name, time.perf_counter() - start, False)
             raise
-        log_event.testcase_end(tc.__name__, time.monotonic() - start, True)
+        testcase_end(name, time.perf_counter() - start, True)
         return result
 
-    setattr(wrapped, "_tbot_testcase", tc.__name__)
+    setattr(wrapped, "_tbot_testcase", name)
     return typing.cast(F_tc, wrapped)
 
 
@@ -95,19 +99,22 @@ def named_testcase(name: str) -> typing.Callable[[F_tc], F_tc]:
     """
 
     def _named_testcase(tc: F_tc) -> F_tc:
+        testcase_begin = log_event.testcase_begin
+        testcase_end = log_event.testcase_end
+
         @functools.wraps(tc)
         def wrapped(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:
-            log_event.testcase_begin(name)
-            start = time.monotonic()
+            testcase_begin(name)
+            start = time.perf_counter()
             try:
                 result = tc(*args, **kwargs)
             except tbot.SkipException as e:
-                log_event.testcase_end(name, time.monotonic() - start, skipped=str(e))
+                testcase_end(name, time.perf_counter() - start, skipped=str(e))
                 return None
             except:  # noqa: E722
-                log_event.testcase_end(name, time.monotonic() - start, False)
+                testcase_end(name, time.perf_counter() - start, False)
                 raise
-            log_event.testcase_end(name, time.monotonic() - start, True)
+            testcase_end(name, time.perf_counter() - start, True)
             return result
 
         setattr(wrapped, "_tbot_testcase", name)
@@ -14,17 +14,22 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import atexit
 import enum
 import io
 import itertools
 import json
 import os
+import queue
 import re
 import sys
+import threading
 import time
 import typing
 import termcolor2
 
+from tbot import ringbuf
+
 
 IS_UNICODE = sys.stdout.encoding == "UTF-8"
 IS_COLOR = False
@@ -77,6 +82,9 @@ class Verbosity(enum.IntEnum):
 
 
 NESTING = -1
+# NESTING is adjusted from testcases which might run in parallel worker
+# threads; the lock keeps concurrent `+= 1`/`-= 1` from losing updates.
+NESTING_LOCK = threading.Lock()
 INTERACTIVE = False
 VERBOSITY = Verbosity.COMMAND
 LOGFILE: typing.Optional[typing.TextIO] = None
@@ -85,6 +93,131 @@ START_TIME = time.monotonic()
 _SPLIT_PATTERN = re.compile("(\r|\n)")
 
 
+# Async log-writer {{{
+
+# Log events are not written to the logfile synchronously.  Instead, the
+# serialized events are collected in a ring of in-memory buffers which a
+# daemon thread writes out.  This way, testcase code never stalls on
+# log-file I/O unless the ring is completely saturated (in which case the
+# producer waits for the writer; events are only ever dropped whole, and
+# only when the writer is gone, so the logfile always stays parseable).
+_RINGBUF = ringbuf.RingBuffer(count=4, size=64 * 1024)
+
+# The logfile is only flushed to disk once more than _FLUSH_THRESHOLD bytes
+# have been written since the last flush or _FLUSH_INTERVAL seconds have
+# passed.  This turns many tiny writes into a few large ones.
+_FLUSH_THRESHOLD = _RINGBUF.size * 3 // 10
+_FLUSH_INTERVAL = 1.0
+
+_writer_thread: typing.Optional[threading.Thread] = None
+_flush_requests: "queue.Queue[threading.Event]" = queue.Queue()
+
+
+def _logfile_write(data: bytes) -> None:
+    if LOGFILE is None:
+        return
+
+    raw = getattr(LOGFILE, "buffer", None)
+    if raw is not None:
+        raw.write(data)
+    else:
+        LOGFILE.write(data.decode("utf-8", errors="replace"))
+
+
+def _writer_loop() -> None:
+    bytes_since_flush = 0
+    last_flush = time.monotonic()
+
+    while True:
+        taken = _RINGBUF.take(timeout=_FLUSH_INTERVAL)
+
+        if taken is not None:
+            token, data = taken
+            try:
+                _logfile_write(data)
+            except Exception:
+                # Even if the logfile broke (eg. it was closed under our
+                # feet), keep consuming so producers never block on a full
+                # ring.
+                pass
+            _RINGBUF.release(token)
+            bytes_since_flush += len(data)
+
+        force_flush = not _flush_requests.empty()
+        if (
+            force_flush
+            or bytes_since_flush > _FLUSH_THRESHOLD
+            or time.monotonic() - last_flush > _FLUSH_INTERVAL
+        ):
+            # Also write out data which has not filled up a whole buffer yet
+            data = _RINGBUF.drain()
+            try:
+                if data != b"":
+                    _logfile_write(data)
+                if LOGFILE is not None:
+                    LOGFILE.flush()
+            except Exception:
+                pass
+            bytes_since_flush = 0
+            last_flush = time.monotonic()
+
+            # Flush requests are signalled once everything before them has
+            # been written out.
+            try:
+                while True:
+                    _flush_requests.get_nowait().set()
+            except queue.Empty:
+                pass
+
+
+def _emit_event(ev: dict) -> None:
+    global _writer_thread
+
+    if LOGFILE is None:
+        return
+
+    if _writer_thread is None:
+        _writer_thread = threading.Thread(
+            target=_writer_loop, name="tbot-log-writer", daemon=True
+        )
+        _writer_thread.start()
+        # atexit handlers run in reverse order: flush first, then report
+        atexit.register(_report_dropped)
+        atexit.register(flush_log)
+
+    _RINGBUF.write((json.dumps(ev, indent=2) + "\n").encode("utf-8"))
+
+
+def flush_log() -> None:
+    """
+    Wait until all pending log events have been written to the logfile.
+
+    This is called automatically when tbot exits; it only needs to be called
+    explicitly if an external consumer wants to read a consistent logfile
+    while tbot is still running.
+    """
+    if _writer_thread is None or not _writer_thread.is_alive():
+        return
+
+    written = threading.Event()
+    _flush_requests.put(written)
+    _RINGBUF.kick()
+    # Don't wait forever, in case the writer died (eg. because the logfile
+    # was closed under its feet during interpreter shutdown).
+    written.wait(timeout=5.0)
+
+
+def _report_dropped() -> None:
+    if _RINGBUF.dropped > 0:
+        sys.stderr.write(
+            f"Warning: {_RINGBUF.dropped} log event(s) were dropped because "
+            + "the log-writer could not keep up.\n"
+        )
+
+
+# }}}
+
+
 class EventIO(io.StringIO):
     """Stream for a log event."""
 
@@ -195,15 +328,13 @@ class EventIO(io.StringIO):
         self._print_stdout(last=True)
 
         if LOGFILE is not None:
-            ev = {
-                "type": self.ty,
-                "time": time.monotonic() - START_TIME,
-                "data": self.data,
-            }
-
-            json.dump(ev, LOGFILE, indent=2)
-            LOGFILE.write("\n")
-            LOGFILE.flush()
+            _emit_event(
+                {
+                    "type": self.ty,
+                    "time": time.monotonic() - START_TIME,
+                    "data": self.data,
+                }
+            )
 
         super().close()
 
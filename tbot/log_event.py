@@ -35,7 +35,8 @@ def testcase_begin(name: str) -> None:
         verbosity=log.Verbosity.QUIET,
         name=name,
     )
-    log.NESTING += 1
+    with log.NESTING_LOCK:
+        log.NESTING += 1
 
 
 def testcase_end(
@@ -75,7 +76,8 @@ def testcase_end(
         skipped=skipped is not None,
         **skip_info,
     )
-    log.NESTING -= 1
+    with log.NESTING_LOCK:
+        log.NESTING -= 1
 
 
 def command(mach: str, cmd: str) -> log.EventIO:
@@ -106,7 +108,8 @@ def command(mach: str, cmd: str) -> log.EventIO:
 
 def tbot_start() -> None:
     print(log.c("tbot").yellow.bold + " starting ...")
-    log.NESTING += 1
+    with log.NESTING_LOCK:
+        log.NESTING += 1
 
 
 def tbot_end(success: bool) -> None:
@@ -144,12 +144,16 @@ class UBootShell(shell.Shell, UbootStartup):
 
     def escape(self, *args: ArgTypes) -> str:
         """Escape a string so it can be used safely on the U-Boot command-line."""
-        string_args = []
+        string_args: typing.List[str] = []
         for arg in args:
-            if isinstance(arg, str):
-                string_args.append(shlex.quote(arg))
+            # Static tokens are str subclasses, so the Special check has to
+            # come first - they must not be quoted.
+            if isinstance(arg, special._Static):
+                string_args.append(arg)
             elif isinstance(arg, special.Special):
                 string_args.append(arg._to_string(self))
+            elif isinstance(arg, str):
+                string_args.append(shlex.quote(arg))
             else:
                 raise TypeError(f"{type(arg)!r} is not a supported argument type!")
 
@@ -247,7 +251,7 @@ class UBootShell(shell.Shell, UbootStartup):
         if value is not None:
             self.exec0("setenv", var, value)
 
-        return self.exec0("echo", special.Raw(f'"${{{self.escape(var)}}}"'))[:-1]
+        return self.exec0("echo", special._env_expansion(var))[:-1]
 
     def boot(self, *args: ArgTypes) -> channel.Channel:
         """
@@ -328,14 +328,14 @@ class Channel(typing.ContextManager):
         :param int max: Maximum number of bytes to read.
         :param float timeout: Optional timeout.
         """
-        start_time = time.clock()
+        start_time = time.perf_counter()
 
         bytes_read = 0
         while True:
             timeout_remaining = None
             if timeout is not None:
-                timeout_remaining = timeout - (time.clock() - start_time)
-                if timeout <= 0:
+                timeout_remaining = timeout - (time.perf_counter() - start_time)
+                if timeout_remaining <= 0:
                     raise TimeoutError()
 
             max_read = min(self.READ_CHUNK_SIZE, max - bytes_read)
@@ -349,6 +349,29 @@ class Channel(typing.ContextManager):
             if bytes_read == max:
                 break
 
+    def read_until_eof(self, timeout: typing.Optional[float] = None) -> bytes:
+        """
+        Read until the remote end closes the channel.
+
+        This polls the channel instead of sleeping for an arbitrary amount of
+        time, so it returns as soon as the channel is actually closed.
+
+        :param float timeout: Optional timeout.  If ``timeout`` is not
+            ``None`` and expires before the channel was closed, an exception
+            is raised.
+        :rtype: bytes
+        :returns: All bytes read before the channel closed.
+        """
+        buf = bytearray()
+
+        try:
+            for chunk in self.read_iter(timeout=timeout):
+                buf += chunk
+        except ChannelClosedException:
+            pass
+
+        return bytes(buf)
+
     # }}}
 
     # log-event streams {{{
@@ -446,6 +469,7 @@ class Channel(typing.ContextManager):
         """
         Close this channel.
 
+        If the remote end has already closed the channel, this is a no-op.
         The following is always true:
 
         .. code-block:: python
@@ -453,6 +477,8 @@ class Channel(typing.ContextManager):
             channel.close()
             assert channel.closed
         """
+        if self._c.closed:
+            return
         self._c.close()
 
     @property
@@ -639,28 +665,26 @@ class Channel(typing.ContextManager):
         finally:
             self.prompt = previous
 
-    def read_until_prompt(
+    def read_until_prompt_bytes(
         self,
         prompt: typing.Optional[ConvenientSearchString] = None,
         timeout: typing.Optional[float] = None,
-    ) -> str:
+    ) -> bytes:
         """
         Read until prompt is detected.
 
-        Read from the channel until the configured prompt string is detected.
-        All data captured up until the prompt is returned, decoded as UTF-8.
-        If ``prompt`` is ``None``, the prompt which was set using
-        :py:meth:`tbot.machine.channel.Channel.with_prompt` is used.
+        Like :py:meth:`read_until_prompt`, but the captured data is returned
+        as raw bytes, without decoding or newline conversion.
 
         :param ConvenientSearchString prompt: The prompt to read up to.  It
             must appear as the very last readable data in the channel's data
             stream.  See :ref:`channel_search_string` for more info about which
             types can be passed for this parameter.
         :param float timeout: Optional timeout.  If ``timeout`` is set and
-            expires before the prompt was detected, ``read_until_prompt``
+            expires before the prompt was detected, ``read_until_prompt_bytes``
             raises an execption.
-        :rtype: str
-        :returns: UTF-8 decoded string of all bytes read up to the prompt.
+        :rtype: bytes
+        :returns: All bytes read up to the prompt.
         """
         ctx: typing.ContextManager[typing.Any]
         if prompt is not None:
@@ -678,24 +702,44 @@ class Channel(typing.ContextManager):
 
                 if isinstance(self.prompt, bytes):
                     if buf.endswith(self.prompt):
-                        return (
-                            buf[: -len(self.prompt)]
-                            .decode("utf-8", errors="replace")
-                            .replace("\r\n", "\n")
-                            .replace("\n\r", "\n")
-                        )
+                        return bytes(buf[: -len(self.prompt)])
                 elif isinstance(self.prompt, BoundedPattern):
                     match = self.prompt.pattern.search(buf)
                     if match is not None:
-                        return (
-                            buf[: match.span()[0]]
-                            .decode("utf-8", errors="replace")
-                            .replace("\r\n", "\n")
-                            .replace("\n\r", "\n")
-                        )
+                        return bytes(buf[: match.span()[0]])
 
         raise RuntimeError("unreachable")
 
+    def read_until_prompt(
+        self,
+        prompt: typing.Optional[ConvenientSearchString] = None,
+        timeout: typing.Optional[float] = None,
+    ) -> str:
+        """
+        Read until prompt is detected.
+
+        Read from the channel until the configured prompt string is detected.
+        All data captured up until the prompt is returned, decoded as UTF-8.
+        If ``prompt`` is ``None``, the prompt which was set using
+        :py:meth:`tbot.machine.channel.Channel.with_prompt` is used.
+
+        :param ConvenientSearchString prompt: The prompt to read up to.  It
+            must appear as the very last readable data in the channel's data
+            stream.  See :ref:`channel_search_string` for more info about which
+            types can be passed for this parameter.
+        :param float timeout: Optional timeout.  If ``timeout`` is set and
+            expires before the prompt was detected, ``read_until_prompt``
+            raises an execption.
+        :rtype: str
+        :returns: UTF-8 decoded string of all bytes read up to the prompt.
+        """
+        return (
+            self.read_until_prompt_bytes(prompt, timeout)
+            .decode("utf-8", errors="replace")
+            .replace("\r\n", "\n")
+            .replace("\n\r", "\n")
+        )
+
     # }}}
 
     # borrowing & taking {{{
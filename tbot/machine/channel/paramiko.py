@@ -14,19 +14,23 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import paramiko
 import socket
 import typing
 
 from . import channel
 
+if typing.TYPE_CHECKING:
+    # Deferred import; paramiko is expensive to load and only needed once an
+    # ssh connection is actually opened.
+    import paramiko
+
 READ_CHUNK_SIZE = 4096
 
 
 class ParamikoChannelIO(channel.ChannelIO):
     __slots__ = ("ch",)
 
-    def __init__(self, ch: paramiko.Channel) -> None:
+    def __init__(self, ch: "paramiko.Channel") -> None:
         self.ch = ch
 
         self.ch.get_pty("xterm-256color", 80, 25, 1024, 1024)
@@ -71,5 +75,5 @@ class ParamikoChannelIO(channel.ChannelIO):
 
 
 class ParamikoChannel(channel.Channel):
-    def __init__(self, ch: paramiko.Channel) -> None:
+    def __init__(self, ch: "paramiko.Channel") -> None:
         super().__init__(ParamikoChannelIO(ch))
@@ -43,6 +43,11 @@ class SubprocessChannelIO(channel.ChannelIO):
             start_new_session=True,
         )
 
+        # Close our copy of the slave end; the child holds its own.  This
+        # way, the master signals EOF as soon as the last process on the
+        # pty exits, instead of reads blocking until their full timeout.
+        os.close(pty_slave)
+
         flags = fcntl.fcntl(self.pty_master, fcntl.F_GETFL)
         flags = flags | os.O_NONBLOCK
         fcntl.fcntl(self.pty_master, fcntl.F_SETFL, flags)
@@ -67,7 +72,16 @@ class SubprocessChannelIO(channel.ChannelIO):
 
         try:
             return channel._debug_log(os.read(self.pty_master, n))
-        except (BlockingIOError, OSError):
+        except BlockingIOError:
+            raise channel.ChannelClosedException
+        except OSError:
+            # EIO means the last process on the pty is gone.  It might not
+            # have been reaped yet, so wait for it to make sure `closed`
+            # reflects the state immediately.
+            try:
+                self.p.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                pass
             raise channel.ChannelClosedException
 
     def close(self) -> None:
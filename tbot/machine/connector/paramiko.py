@@ -16,7 +16,6 @@
 
 import abc
 import getpass
-import paramiko
 import pathlib
 import typing
 
@@ -25,6 +24,11 @@ from .. import channel
 from ..linux import auth
 from . import connector
 
+if typing.TYPE_CHECKING:
+    # Deferred import; paramiko is expensive to load and only needed once an
+    # ssh connection is actually opened.
+    import paramiko
+
 Self = typing.TypeVar("Self", bound="ParamikoConnector")
 
 
@@ -135,7 +139,7 @@ class ParamikoConnector(connector.Connector):
         :param ParamikoConnector other: Build this connection by opening a new
             channel in an existing ssh-connection.
         """
-        self._client: typing.Optional[paramiko.SSHClient] = None
+        self._client: "typing.Optional[paramiko.SSHClient]" = None
         self._config: typing.Dict[str, typing.Union[str, typing.List[str]]] = {}
 
         if other is not None:
@@ -143,6 +147,8 @@ class ParamikoConnector(connector.Connector):
             self._config = other._config
 
     def _connect(self) -> channel.Channel:
+        import paramiko
+
         if self._client is None:
             self._client = paramiko.SSHClient()
 
@@ -84,12 +84,16 @@ class Bash(linux_shell.LinuxShell):
     def escape(
         self: Self, *args: typing.Union[str, special.Special[Self], path.Path[Self]]
     ) -> str:
-        string_args = []
+        string_args: typing.List[str] = []
         for arg in args:
-            if isinstance(arg, str):
-                string_args.append(shlex.quote(arg))
+            # Static tokens are str subclasses, so the Special check has to
+            # come first - they must not be quoted.
+            if isinstance(arg, special._Static):
+                string_args.append(arg)
             elif isinstance(arg, linux_shell.Special):
                 string_args.append(arg._to_string(self))
+            elif isinstance(arg, str):
+                string_args.append(shlex.quote(arg))
             elif isinstance(arg, path.Path):
                 if arg.host is not self:
                     raise Exception("{arg!r} is for another host!")
@@ -138,7 +142,7 @@ class Bash(linux_shell.LinuxShell):
                 "export", special.Raw(f"{self.escape(var)}={self.escape(value)}")
             )
 
-        return self.exec0("echo", special.Raw(f'"${{{self.escape(var)}}}"'))[:-1]
+        return self.exec0("echo", special._env_expansion(var))[:-1]
 
     def open_channel(
         self: Self, *args: typing.Union[str, special.Special[Self], path.Path[Self]]
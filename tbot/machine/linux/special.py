@@ -15,6 +15,7 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import abc
+import functools
 import shlex
 import typing
 
@@ -41,6 +42,17 @@ class Raw(Special[H]):
         return self.string
 
 
+@functools.lru_cache(maxsize=256)
+def _env_expansion(var: str) -> "Raw":
+    """
+    Return a ``Raw`` token which expands the environment variable ``var``.
+
+    The token is fully determined by the variable name, so instances are
+    cached and shared between the repeated ``env()`` calls of all shells.
+    """
+    return Raw(f'"${{{shlex.quote(var)}}}"')
+
+
 class _Stdio(Special[H]):
     __slots__ = ("file",)
 
@@ -66,14 +78,21 @@ class RedirStderr(_Stdio[H]):
     _redir_token = "2>"
 
 
-class _Static(Special):
-    __slots__ = ("string",)
+class _Static(str, Special):
+    """
+    Static command-line token.
 
-    def __init__(self, string: str) -> None:
-        self.string = string
+    These tokens are immutable module-level singletons.  As a ``str``
+    subclass, a ``_Static`` *is* the string it renders to, so command
+    builders can use it directly without going through a ``_to_string()``
+    dispatch - they only have to take care not to quote it like an ordinary
+    string argument.
+    """
+
+    __slots__ = ()
 
     def _to_string(self, _: H) -> str:
-        return self.string
+        return self
 
 
 AndThen = _Static("&&")
@@ -231,6 +231,17 @@ def main() -> None:  # noqa: C901
         return
     # }}}
 
+    # Resolve all requested testcases up front; this catches typos before
+    # anything runs and saves the repeated dict lookups in the run-loop.
+    try:
+        run_queue = [(name, testcases[name]) for name in args.testcase]
+    except KeyError as e:
+        print(
+            log.c("Error").red.bold + f": unknown testcase {e.args[0]!r}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
     log_event.tbot_start()
 
     import tbot
@@ -291,9 +302,7 @@ def main() -> None:  # noqa: C901
     # }}}
 
     try:
-        for tc in args.testcase:
-            func = testcases[tc]
-
+        for tc, func in run_queue:
             if len(args.testcase) == 1:
                 params = parameters
             else:
@@ -306,21 +315,29 @@ def main() -> None:  # noqa: C901
                 # Get list of argument names
                 argspec = inspect.getargs(func_code)
 
-                params = {}
-                for name, value in parameters.items():
-                    if argspec.varkw is not None or name in argspec.args:
-                        params[name] = value
-                    else:
-                        tbot.log.warning(
-                            f"Parameter {name!r} not defined for testcase {tc!r}, ignoring ..."
-                        )
+                if argspec.varkw is not None:
+                    # Testcase takes **kwargs; copy the parameters in bulk
+                    params = parameters.copy()
+                else:
+                    params = {}
+                    for name, value in parameters.items():
+                        if name in argspec.args:
+                            params[name] = value
+                        else:
+                            tbot.log.warning(
+                                f"Parameter {name!r} not defined for testcase {tc!r}, ignoring ..."
+                            )
 
             func(**params)
     except Exception as e:  # noqa: E722
-        import traceback
-
-        trace = traceback.format_exc()
-        log_event.exception(e.__class__.__name__, trace)
+        if getattr(e, "_tbot_already_logged", False):
+            # Don't render the traceback a second time
+            log_event.exception(e.__class__.__name__, str(e))
+        else:
+            import traceback
+
+            trace = traceback.format_exc()
+            log_event.exception(e.__class__.__name__, trace)
         log_event.tbot_end(False)
         sys.exit(1)
     except KeyboardInterrupt:
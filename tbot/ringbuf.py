@@ -0,0 +1,223 @@
+# tbot, Embedded Automation Tool
+# Copyright (C) 2019  Harald Seiler
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import enum
+import threading
+import typing
+
+
+@enum.unique
+class _State(enum.Enum):
+    EMPTY = 0
+    FILLING = 1
+    FULL = 2
+    FLUSHING = 3
+
+
+class RingBuffer:
+    """
+    A small ring of preallocated, fixed-size buffers.
+
+    A producer appends data into the buffer which is currently ``FILLING``
+    using :py:meth:`write`.  Once a buffer is (nearly) full, it is flipped to
+    ``FULL`` and a consumer thread is signalled, which picks it up with
+    :py:meth:`take` (``FLUSHING``) and hands it back with :py:meth:`release`
+    (``EMPTY``).  This way, the producer only ever touches in-memory buffers
+    and never waits for the consumer's I/O.
+
+    Each :py:meth:`write` is treated as one atomic record: it is stored
+    either completely or not at all.  When the ring is saturated, the
+    producer blocks until the consumer has caught up; only when no consumer
+    frees up space at all (e.g. because it died) is the record dropped as a
+    whole and counted in :py:attr:`dropped`.
+    """
+
+    def __init__(self, count: int = 4, size: int = 64 * 1024) -> None:
+        """
+        :param int count: Number of preallocated buffers.
+        :param int size: Size of each buffer, in bytes.
+        """
+        assert count >= 2
+
+        self.size = size
+        self._buffers = [bytearray(size) for _ in range(count)]
+        self._states = [_State.EMPTY for _ in range(count)]
+        self._fill = [0 for _ in range(count)]
+        self._head = 0
+        self._states[0] = _State.FILLING
+        self._cond = threading.Condition()
+        # Serializes producers so concurrent records cannot interleave while
+        # one of them is waiting for the consumer to free up a buffer.
+        self._write_lock = threading.Lock()
+        self._kicked = False
+        self._consumer_seen = False
+        self.dropped = 0
+
+    def _free(self) -> int:
+        # Number of bytes which can be stored without waiting for the
+        # consumer.  Must be called with the lock held.
+        free = sum(self.size for state in self._states if state is _State.EMPTY)
+        if self._states[self._head] is _State.FILLING:
+            free += self.size - self._fill[self._head]
+        return free
+
+    def _advance(self) -> None:
+        # Move the producer to an EMPTY buffer.  Must only be called (with
+        # the lock held) when _free() guarantees that one exists.
+        if self._states[self._head] is _State.FILLING:
+            self._states[self._head] = _State.FULL
+
+        nxt = (self._head + 1) % len(self._buffers)
+        while self._states[nxt] is not _State.EMPTY:
+            nxt = (nxt + 1) % len(self._buffers)
+
+        self._states[nxt] = _State.FILLING
+        self._fill[nxt] = 0
+        self._head = nxt
+
+    def write(self, data: bytes, timeout: float = 5.0) -> None:
+        """
+        Append ``data`` to the ring as one atomic record.
+
+        A record is stored either completely or not at all - a truncated
+        record would corrupt the data stream for its consumers.  If the ring
+        does not have enough free space, ``write()`` blocks until the
+        consumer has caught up; if that does not happen within ``timeout``
+        seconds, the record is dropped as a whole and counted in
+        :py:attr:`dropped`.
+
+        Records larger than the whole ring are streamed through it buffer by
+        buffer.  This requires an attached consumer; without one, such a
+        record is dropped immediately.  Once streaming has started, the
+        producer waits for the consumer indefinitely, as giving up would
+        truncate the record.
+        """
+        capacity = self.size * len(self._buffers)
+
+        with self._write_lock, self._cond:
+            if len(data) > capacity:
+                # The record can never fit completely; stream it through the
+                # ring below, relying on the consumer to drain it meanwhile.
+                if not self._consumer_seen:
+                    self.dropped += 1
+                    return
+            else:
+                # Wait until the whole record fits, so it can be stored
+                # without any further waiting.
+                if not self._cond.wait_for(
+                    lambda: self._free() >= len(data), timeout
+                ):
+                    self.dropped += 1
+                    return
+
+            while data != b"":
+                if self._free() == 0:
+                    # Only reachable for oversized records: wait for the
+                    # consumer to take a buffer off our hands.
+                    self._cond.wait_for(lambda: self._free() > 0)
+
+                if (
+                    self._states[self._head] is not _State.FILLING
+                    or self._fill[self._head] == self.size
+                ):
+                    self._advance()
+
+                fill = self._fill[self._head]
+                space = self.size - fill
+                chunk = data[:space]
+                self._buffers[self._head][fill : fill + len(chunk)] = chunk
+                self._fill[self._head] += len(chunk)
+                data = data[space:]
+
+                if self._fill[self._head] == self.size:
+                    # Hand the filled buffer to the consumer right away so it
+                    # can flush while we continue filling the next one.
+                    self._states[self._head] = _State.FULL
+                    self._cond.notify_all()
+
+    def kick(self) -> None:
+        """Wake up a consumer blocking in :py:meth:`take`."""
+        with self._cond:
+            self._kicked = True
+            self._cond.notify_all()
+
+    def _oldest_full(self) -> typing.Optional[int]:
+        # Scan in ring order, starting just behind the producer, so the
+        # oldest FULL buffer is found first.  Must be called with the lock
+        # held.
+        count = len(self._buffers)
+        for off in range(1, count + 1):
+            i = (self._head + off) % count
+            if self._states[i] == _State.FULL:
+                return i
+        return None
+
+    def take(
+        self, timeout: typing.Optional[float] = None
+    ) -> typing.Optional[typing.Tuple[int, bytes]]:
+        """
+        Wait for a full buffer and take ownership of it.
+
+        :returns: A ``(token, data)`` tuple or ``None`` if the timeout
+            expired (or :py:meth:`kick` was called) before a buffer was
+            filled.  The token must be handed back via :py:meth:`release`
+            once the data has been written out.
+        """
+        with self._cond:
+            self._consumer_seen = True
+            self._cond.wait_for(
+                lambda: self._kicked or self._oldest_full() is not None, timeout
+            )
+            self._kicked = False
+
+            i = self._oldest_full()
+            if i is None:
+                return None
+
+            self._states[i] = _State.FLUSHING
+            return (i, bytes(self._buffers[i][: self._fill[i]]))
+
+    def release(self, token: int) -> None:
+        """Mark a previously taken buffer as reusable."""
+        with self._cond:
+            assert self._states[token] == _State.FLUSHING
+            self._states[token] = _State.EMPTY
+            self._fill[token] = 0
+            # A producer might be waiting for free space
+            self._cond.notify_all()
+
+    def drain(self) -> bytes:
+        """
+        Take all buffered data, including the partially filled buffer.
+
+        This is used when a flush is forced and even data which has not yet
+        filled up a whole buffer should be written out.
+        """
+        with self._cond:
+            data = bytearray()
+            count = len(self._buffers)
+            for off in range(1, count + 1):
+                i = (self._head + off) % count
+                if self._states[i] == _State.FULL or (
+                    self._states[i] == _State.FILLING and self._fill[i] > 0
+                ):
+                    data += self._buffers[i][: self._fill[i]]
+                    self._fill[i] = 0
+                    if self._states[i] == _State.FULL:
+                        self._states[i] = _State.EMPTY
+            # A producer might be waiting for free space
+            self._cond.notify_all()
+            return bytes(data)
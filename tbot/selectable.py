@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import atexit
+import threading
 import typing
 from tbot.machine import connector, linux, board
 
@@ -26,16 +28,38 @@ class LocalLabHost(
 
 LabHost = LocalLabHost
 
+_lab: typing.Optional[LabHost] = None
+_lab_owner: typing.Optional[threading.Thread] = None
+_lab_lock = threading.Lock()
+
+
+def _release_lab() -> None:
+    global _lab, _lab_owner
+    if _lab is not None:
+        lab, _lab = _lab, None
+        _lab_owner = None
+        atexit.unregister(_release_lab)
+        lab.__exit__(None, None, None)
+
 
 def acquire_lab() -> LabHost:
     """
-    Acquire a new connection to the LabHost.
+    Acquire a connection to the LabHost.
 
-    If your lab-host is using a :class:`~tbot.machine.connector.ParamikoConnector`
-    this will create a new ssh connection.
+    The connection is only established on the first call; subsequent calls
+    re-enter the already-open machine, so for a
+    :class:`~tbot.machine.connector.ParamikoConnector` based lab-host, the ssh
+    handshake is only paid once per run.  The connection is torn down when
+    tbot exits.
 
-    You should call this function as little as possible, because it can be very slow.
-    If possible, try to reuse the labhost. A recipe for doing so is
+    A machine's channel must never be used from multiple threads at once, so
+    only the thread which first acquired the lab-host shares the cached
+    machine; calls from other threads (eg. from
+    :py:func:`tbot.tc.testsuite_parallel` workers) get their own
+    :py:meth:`~tbot.machine.machine.Machine.clone` of it instead.
+
+    To make a testcase callable with an already-acquired lab-host as well,
+    use the following recipe:
 
     .. code-block:: python
 
@@ -53,9 +77,33 @@ def acquire_lab() -> LabHost:
 
     :rtype: tbot.selectable.LabHost
     """
+    global _lab, _lab_owner
+
     if hasattr(LabHost, "_unselected"):
         raise NotImplementedError("Maybe you haven't set a lab?")
-    return LabHost()
+
+    with _lab_lock:
+        if _lab is not None and (type(_lab) is not LabHost or _lab.ch.closed):
+            # A different lab was selected or the connection died; drop the
+            # cached machine.
+            _release_lab()
+
+        if _lab is None:
+            lab = LabHost()
+            # Keep one reference active until tbot exits, so the machine
+            # survives the context-blocks of individual testcases.
+            lab.__enter__()
+            _lab = lab
+            _lab_owner = threading.current_thread()
+            atexit.register(_release_lab)
+
+        if threading.current_thread() is not _lab_owner:
+            # Sharing the cached machine with another thread would garble
+            # its channel; hand out an independent clone instead, which the
+            # caller's `with`-block closes like any other machine.
+            return _lab.clone()
+
+        return _lab
 
 
 def acquire_local() -> LocalLabHost:
@@ -1,7 +1,11 @@
+import concurrent.futures
+import os
 import typing
 import tbot
 import traceback
 
+from tbot.machine import linux
+
 
 @tbot.testcase
 def testsuite(*args: typing.Callable, **kwargs: typing.Any) -> None:
@@ -36,14 +40,67 @@ def testsuite(*args: typing.Callable, **kwargs: typing.Any) -> None:
                     lab=lh,
                 )
     """
-    errors: typing.List[typing.Tuple[str, str]] = []
+    errors: typing.List[typing.Tuple[str, BaseException]] = []
 
     for test in args:
         try:
             test(**kwargs)
-        except Exception:
-            errors.append((test.__name__, traceback.format_exc()))
+        except Exception as e:
+            errors.append((test.__name__, e))
+
+    _suite_results(errors, len(args))
+
+
+@tbot.testcase
+def testsuite_parallel(
+    *args: typing.Callable,
+    lab: typing.Optional[linux.LinuxShell] = None,
+    **kwargs: typing.Any,
+) -> None:
+    """
+    Run a number of tests concurrently and report how many of them succeeded.
 
+    Tests are dispatched to a pool of worker threads.  As most testcases
+    spend the bulk of their time waiting for command output, independent
+    tests can overlap their I/O this way and the suite finishes in roughly
+    the time of its slowest test instead of the sum of all tests.
+
+    :param args: Testcases.  They must not depend on each other's
+        side-effects as their execution order is no longer defined.
+    :param lab: Lab-host machine.  Each worker gets its own
+        :py:meth:`~tbot.machine.machine.Machine.clone` of this machine so
+        the tests don't fight over a single channel.
+    :param kwargs: Named-Arguments that should be given to each testcase.
+        Be aware that this requires all testcases to have compatible
+        signatures.
+    """
+    max_workers = max(1, (os.cpu_count() or 1) - 2)
+
+    def run(test: typing.Callable) -> None:
+        if lab is not None:
+            with lab.clone() as lh:
+                test(lab=lh, **kwargs)
+        else:
+            test(**kwargs)
+
+    errors: typing.List[typing.Tuple[str, BaseException]] = []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [(test.__name__, pool.submit(run, test)) for test in args]
+
+        for name, future in futures:
+            exc = future.exception()
+            if exc is not None:
+                errors.append((name, exc))
+
+    _suite_results(errors, len(args))
+
+
+def _suite_results(
+    errors: typing.List[typing.Tuple[str, BaseException]], num: int
+) -> None:
+    # Tracebacks are only rendered here, once the suite is done; a failing
+    # test does not pay for the formatting while the suite is still running.
     with tbot.log.message(
         tbot.log.c(
             tbot.log.u(
@@ -55,13 +112,19 @@ def testsuite(*args: typing.Callable, **kwargs: typing.Any) -> None:
         if errors != []:
             ev.writeln(
                 tbot.log.c("Failure").red.bold
-                + f": {len(errors)}/{len(args)} tests failed\n"
+                + f": {len(errors)}/{num} tests failed\n"
             )
             for tc, err in errors:
-                tbot.log.message(tbot.log.c(tc).blue + ":\n" + err)
-            raise Exception(f"{len(errors)}/{len(args)} tests failed")
+                trace = "".join(
+                    traceback.format_exception(type(err), err, err.__traceback__)
+                )
+                tbot.log.message(tbot.log.c(tc).blue + ":\n" + trace)
+            exc = Exception(f"{len(errors)}/{num} tests failed")
+            # The individual failures were already logged above; tell the
+            # top-level handler not to render a traceback for this one again.
+            setattr(exc, "_tbot_already_logged", True)
+            raise exc
         else:
             ev.writeln(
-                tbot.log.c("Success").green.bold
-                + f": {len(args)}/{len(args)} tests passed"
+                tbot.log.c("Success").green.bold + f": {num}/{num} tests passed"
             )
@@ -64,7 +64,7 @@ def selftest_skipping(lab: typing.Optional[linux.Lab] = None,) -> None:
 def selftest(lab: typing.Optional[linux.Lab] = None,) -> None:
     """Run all selftests."""
     with lab or tbot.acquire_lab() as lh:
-        tc.testsuite(
+        tc.testsuite_parallel(
             selftest_failing,
             selftest_skipping,
             selftest_uname,
@@ -84,6 +84,14 @@ def selftest(lab: typing.Optional[linux.Lab] = None,) -> None:
             board_machine.selftest_board_linux_nopw,
             board_machine.selftest_board_linux_bad_console,
             testcase.selftest_with_lab,
+            lab=lh,
+        )
+
+        # These patch the board/U-Boot/Linux selections in tbot.selectable
+        # for their duration (SubstituteBoard), which are process-wide
+        # globals - so they must not run concurrently with each other or
+        # anything else.
+        tc.testsuite(
             testcase.selftest_with_uboot,
             testcase.selftest_with_linux,
             lab=lh,
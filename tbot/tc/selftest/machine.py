@@ -29,6 +29,15 @@ __all__ = (
     "selftest_machine_sshlab_shell",
 )
 
+_BG_RE = re.compile(r"\[\d+\] \d+\nHello World")
+
+# Long command-line used to check that nothing gets mangled on the way to the
+# shell and back
+_LONG_LINE = "_".join(f"{i:02}" for i in range(80))
+
+# Marker line separating the outputs of fused commands
+_OUT_SENTINEL = "---TBOT---"
+
 
 @tbot.testcase
 def selftest_machine_reentrant(lab: typing.Optional[linux.Lab] = None,) -> None:
@@ -78,7 +87,9 @@ def selftest_machine_sshlab_shell(lab: typing.Optional[linux.Lab] = None,) -> No
         if not minisshd.check_minisshd(lh):
             tbot.skip("dropbear is not installed so ssh can't be tested")
 
-        with minisshd.minisshd(lh) as ssh:
+        # Use a different port than selftest_machine_ssh_shell, the two tests
+        # might run concurrently (testsuite_parallel).
+        with minisshd.minisshd(lh, port=2023) as ssh:
             ssh.exec0("true")
 
             tbot.log.message(tbot.log.c("Testing with paramiko ...").bold)
@@ -102,25 +113,34 @@ def selftest_machine_shell(m: typing.Union[linux.LinuxShell, board.UBootShell])
         #     cap.extend(["printf", "control"])
 
     tbot.log.message("Testing command output ...")
-    out = m.exec0("echo", "Hello World")
-    assert out == "Hello World\n", repr(out)
-
-    out = m.exec0("echo", "$?", "!#")
-    assert out == "$? !#\n", repr(out)
+    # These checks are all independent, so they are fused into a single
+    # compound command with their outputs separated by a sentinel line.
+    # This way, only one round-trip is paid for the whole block.
+    checks: typing.List[typing.Tuple[typing.Tuple[str, ...], str]] = [
+        (("echo", "Hello World"), "Hello World\n"),
+        (("echo", "$?", "!#"), "$? !#\n"),
+    ]
 
     if "printf" in cap:
-        out = m.exec0("printf", "Hello World")
-        assert out == "Hello World", repr(out)
-
-        out = m.exec0("printf", "Hello\\nWorld")
-        assert out == "Hello\nWorld", repr(out)
-
-        out = m.exec0("printf", "Hello\nWorld")
-        assert out == "Hello\nWorld", repr(out)
-
-    s = "_".join(map(lambda i: f"{i:02}", range(80)))
-    out = m.exec0("echo", s)
-    assert out == f"{s}\n", repr(out)
+        checks += [
+            (("printf", "Hello World"), "Hello World"),
+            (("printf", "Hello\\nWorld"), "Hello\nWorld"),
+            (("printf", "Hello\nWorld"), "Hello\nWorld"),
+        ]
+
+    checks.append((("echo", _LONG_LINE), _LONG_LINE + "\n"))
+
+    fused: typing.List[typing.Any] = []
+    for check_args, _ in checks:
+        fused += check_args
+        fused += (linux.Then, "echo", _OUT_SENTINEL, linux.Then)
+    del fused[-1]
+
+    out = m.exec0(*fused)
+    parts = out.split(_OUT_SENTINEL + "\n")
+    assert parts[-1] == "", repr(out)
+    for (check_args, expected), actual in zip(checks, parts):
+        assert actual == expected, f"{check_args!r} printed {actual!r}"
 
     tbot.log.message("Testing return codes ...")
     assert m.test("true")
@@ -160,19 +180,25 @@ def selftest_machine_shell(m: typing.Union[linux.LinuxShell, board.UBootShell])
         # assert out != "/tmp/f o/bar:${PATH}", repr(out)
 
         if "jobs" in cap:
-            t1 = time.monotonic()
+            t1 = time.perf_counter()
             out = m.exec0(
                 "sleep", "10", linux.Background, "echo", "Hello World"
             ).strip()
-            t2 = time.monotonic()
+            t2 = time.perf_counter()
 
-            assert re.match(r"\[\d+\] \d+\nHello World", out), repr(out)
+            assert _BG_RE.match(out), repr(out)
             assert (
                 t2 - t1
             ) < 9.0, (
                 f"Command took {t2 - t1}s (max 9s). Sleep was not sent to background"
             )
 
+            # Reap the background job so it does not keep the shell session
+            # alive when this machine is closed.  The `wait` makes bash print
+            # the job-termination notice here instead of during a later
+            # command.
+            m.exec0("kill", "%1", linux.AndThen, "wait", "%1", linux.OrElse, "true")
+
         if "control" in cap:
             out = m.exec0(
                 "false", linux.AndThen, "echo", "FOO", linux.OrElse, "echo", "BAR"
@@ -210,56 +236,57 @@ def selftest_machine_shell(m: typing.Union[linux.LinuxShell, board.UBootShell])
 
 @tbot.testcase
 def selftest_machine_channel(ch: channel.Channel, remote_close: bool) -> None:
-    tbot.skip("Channel tests need to be reimplemented for machine-v2")
-
-    out = ch.raw_command("echo Hello World", timeout=1)
-    assert out == "Hello World\n", repr(out)
-
-    # Check recv_n
+    # The machine owning this channel has initialized the shell, so the
+    # channel's prompt is set and we can talk to it directly.
+    # Compare the raw bytes (the pty uses CRLF line-endings); this skips the
+    # UTF-8 decode and newline conversion of read_until_prompt().
+    ch.sendline("echo Hello World", read_back=True)
+    out = ch.read_until_prompt_bytes(timeout=5)
+    assert out == b"Hello World\r\n", repr(out)
+
+    # Check reading an exact number of bytes (of the terminal's echo)
     ch.send("echo Foo Bar\n")
-    out2 = ch.recv_n(8, timeout=1.0)
-    assert out2 == b"echo Foo", repr(out)
-    ch.read_until_prompt(channel.TBOT_PROMPT)
+    out2 = ch.read(8, timeout=1)
+    assert out2 == b"echo Foo", repr(out2)
+    ch.read_until_prompt_bytes(timeout=5)
 
     # Check timeout
     raised = False
     try:
-        ch.send("echo Foo Bar")
-        ch.read_until_prompt(channel.TBOT_PROMPT, timeout=0)
+        ch.sendline("echo Foo Bar")
+        ch.read_until_prompt(timeout=0)
     except TimeoutError:
         raised = True
     assert raised
-    ch.send("\n")
-    ch.read_until_prompt(channel.TBOT_PROMPT)
+    ch.read_until_prompt(timeout=5)
 
-    assert ch.isopen()
+    assert not ch.closed
 
     if remote_close:
-        ch.send("exit\n")
-        time.sleep(0.1)
-        ch.recv(timeout=1)
+        ch.sendline("exit")
+        ch.read_until_eof(timeout=5)
 
         raised = False
         try:
-            ch.recv(timeout=1)
+            ch.read(timeout=1)
         except channel.ChannelClosedException:
             raised = True
         assert raised
     else:
         ch.close()
 
-    assert not ch.isopen()
+    assert ch.closed
 
     raised = False
     try:
-        ch.send("\n")
+        ch.sendline("")
     except channel.ChannelClosedException:
         raised = True
     assert raised
 
     raised = False
     try:
-        ch.recv(timeout=1)
+        ch.read(timeout=1)
     except channel.ChannelClosedException:
         raised = True
     assert raised
@@ -113,7 +113,9 @@ def minisshd(h: linux.Lab, port: int = 2022) -> typing.Generator:
     :param int port: Port for the ssh server, defaults to ``2022``.
     :rtype: MiniSSHMachine
     """
-    server_dir = h.workdir / "minisshd"
+    # Each server gets its own directory, so multiple servers (on different
+    # ports) can run concurrently without fighting over pid-file and key.
+    server_dir = h.workdir / f"minisshd-{port}"
     h.exec0("mkdir", "-p", server_dir)
 
     key_file = server_dir / "ssh_host_key"
@@ -123,7 +125,7 @@ def minisshd(h: linux.Lab, port: int = 2022) -> typing.Generator:
     if not key_file.exists():
         h.exec0("dropbearkey", "-t", "rsa", "-f", key_file)
 
-    h.exec0("dropbear", "-p", "127.0.0.1:2022", "-r", key_file, "-P", pid_file)
+    h.exec0("dropbear", "-p", f"127.0.0.1:{port}", "-r", key_file, "-P", pid_file)
 
     # Try reading the file again if it does not yet exist
     for i in range(10):